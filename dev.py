@@ -12,19 +12,11 @@ import sys
 
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
-if len(sys.argv) > 1 and any('--debug' == arg for arg in sys.argv):
-    print("🐞 Debug mode enabled [DEV]")
-    os.environ["DEBUG"] = "1"
-    os.environ['LOGGING'] = "1"
-    os.environ.pop('NO_LOGGING', None)
-    os.environ['TRACEBACK'] = "1"
-    os.environ["LOGGING"] = "1"
-    LOG_LEVEL = "DEBUG"
-    print("start load 'pydebugger' module ...")
-    print("finish load 'pydebugger' module ...")
+_TRUTHY = frozenset({'1', 'true', 'ok', 'on', 'yes'})
 
-elif str(os.getenv('DEBUG', '0')).lower() in ['1', 'true', 'ok', 'on', 'yes']:
+if '--debug' in sys.argv or os.getenv('DEBUG', '0').lower() in _TRUTHY:
     print("🐞 Debug mode enabled [DEV]")
+    os.environ["DEBUG"] = "1"
     os.environ['LOGGING'] = "1"
     os.environ.pop('NO_LOGGING', None)
     os.environ['TRACEBACK'] = "1"
@@ -60,14 +52,19 @@ except:
 
 
 import time
+import fnmatch
+import queue
 import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 import shutil
 import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
 import argparse
 try:
     from licface import CustomRichHelpFormatter
@@ -82,6 +79,27 @@ except ImportError:
     GROWL_AVAILABLE = False
     GrowlNotifier = None
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    FileSystemEventHandler = object
+
+# Fast non-cryptographic hashers for change detection (fallback: sha256)
+try:
+    import xxhash
+    HASH_FACTORY = xxhash.xxh3_64
+except ImportError:
+    try:
+        import blake3
+        HASH_FACTORY = lambda: blake3.blake3(max_threads=blake3.blake3.AUTO)  # noqa: E731
+    except ImportError:
+        HASH_FACTORY = hashlib.sha256
+
+HASH_NAME = HASH_FACTORY().name
 try:
     from rich.console import Console, Group
     from rich.panel import Panel
@@ -99,6 +117,18 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+ICON_PATH = Path(__file__).with_name("pypihub.png")
+HASH_CACHE_NAME = ".pypihub_sync_cache.json"
+HASH_CACHE_SAVE_INTERVAL = 60.0  # seconds
+FULL_SWEEP_INTERVAL = 300.0  # seconds, watch mode only
+CHUNK_SIZE = 1 << 20  # 1 MiB read/copy chunk
+
+NOTIFICATION_DEBOUNCE = 0.5  # seconds
+NOTIFICATION_SUMMARIES = {
+    "file_changed": "files synchronized",
+    "sync_error": "files failed to sync",
+}
+
 @dataclass
 class FilePair:
     """Represents a source-target file pair for synchronization"""
@@ -108,6 +138,60 @@ class FilePair:
     last_sync: Optional[datetime] = None
     status: str = "pending"
     error_count: int = 0
+    last_source_mtime_ns: int = 0
+    last_source_size: int = -1
+    last_target_mtime_ns: int = 0
+    last_target_size: int = -1
+    
+    # Rendering constants, derived once from the (immutable) source path
+    display_name: str = field(init=False, repr=False)
+    index_str: str = field(default="", init=False, repr=False)
+    _size: Optional[int] = field(default=None, init=False, repr=False)
+    _last_stat_time: float = field(default=0.0, init=False, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        name = self.source.name
+        self.display_name = name[:17] + "..." if len(name) > 20 else name
+    
+    def note_size(self, size: int):
+        """Record a freshly observed source size so the renderer need not stat"""
+        self._size = size
+        self._last_stat_time = time.monotonic()
+    
+    def cached_size(self) -> Optional[int]:
+        """Source file size, re-read at most once per second"""
+        now = time.monotonic()
+        if now - self._last_stat_time >= 1.0:
+            self._last_stat_time = now
+            try:
+                self._size = self.source.stat().st_size
+            except OSError:
+                self._size = None
+        return self._size
+    
+    def remember_stat(self, source_stat: os.stat_result, target_stat: os.stat_result):
+        """Remember (mtime_ns, size) of both sides after a verified sync"""
+        self.last_source_mtime_ns = source_stat.st_mtime_ns
+        self.last_source_size = source_stat.st_size
+        self.last_target_mtime_ns = target_stat.st_mtime_ns
+        self.last_target_size = target_stat.st_size
+    
+    def is_unchanged(self, source_stat: os.stat_result) -> bool:
+        """Check whether both files still match the remembered (mtime_ns, size)"""
+        if self.last_hash is None:
+            return False
+        if (source_stat.st_mtime_ns, source_stat.st_size) != (self.last_source_mtime_ns, self.last_source_size):
+            return False
+        return self.target_unchanged()
+    
+    def target_unchanged(self) -> bool:
+        """Check whether the target still matches the remembered (mtime_ns, size)"""
+        try:
+            target_stat = os.stat(self.target)
+        except OSError:
+            return False
+        return (target_stat.st_mtime_ns, target_stat.st_size) == (self.last_target_mtime_ns, self.last_target_size)
     
     def validate(self) -> Tuple[bool, str]:
         """Validate the file pair"""
@@ -117,6 +201,75 @@ class FilePair:
             return False, f"Source is not a file: {self.source}"
         return True, ""
 
+class SyncEventHandler(FileSystemEventHandler):
+    """Map filesystem events back to their FilePair and enqueue them"""
+    
+    def __init__(
+        self,
+        pairs_by_source: Dict[str, FilePair],
+        pairs_by_target: Dict[str, FilePair],
+        pending: "queue.Queue[FilePair]"
+    ):
+        super().__init__()
+        self.pairs_by_source = pairs_by_source
+        self.pairs_by_target = pairs_by_target
+        self.pending = pending
+    
+    def _enqueue(self, path: str, targets_only: bool = False):
+        pair = self.pairs_by_target.get(path)
+        if pair is None and not targets_only:
+            pair = self.pairs_by_source.get(path)
+        if pair is not None:
+            self.pending.put(pair)
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+    
+    def on_deleted(self, event):
+        # A deleted target gets restored; a deleted source is usually a transient
+        # state of an editor save and is left to the following create event
+        if not event.is_directory:
+            self._enqueue(event.src_path, targets_only=True)
+    
+    def on_moved(self, event):
+        # Editors often save via write-to-temp + rename
+        if not event.is_directory:
+            self._enqueue(event.src_path, targets_only=True)
+            self._enqueue(event.dest_path)
+
+def _fast_copy(src: Path, dst: Path):
+    """Copy a file with metadata (CopyFileExW on Windows, shutil.copy2 elsewhere)
+
+    On POSIX, shutil.copy2 already uses a kernel-side copy (sendfile on Linux,
+    fcopyfile on macOS) since Python 3.8.
+    """
+    if os.name == 'nt':
+        import ctypes
+        from ctypes import wintypes
+        copy_file_ex = ctypes.windll.kernel32.CopyFileExW  # type: ignore
+        copy_file_ex.argtypes = [
+            wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p,
+            ctypes.c_void_p, ctypes.POINTER(wintypes.BOOL), wintypes.DWORD
+        ]
+        copy_file_ex.restype = wintypes.BOOL
+        if not copy_file_ex(str(src), str(dst), None, None, None, 0):
+            raise ctypes.WinError()  # type: ignore
+        return
+    
+    shutil.copy2(src, dst)
+
+def is_network_path(path: Path) -> bool:
+    """Check whether a path lives on a network share (inotify & co. do not see remote changes)"""
+    text = str(path)
+    if text.startswith(('\\\\', '//')):
+        return True
+    return text.startswith(('/mnt/nfs', '/net/', '/mnt/smb', '/mnt/cifs'))
+
 class SyncMonitor:
     """Main synchronization monitor class"""
     
@@ -128,14 +281,36 @@ class SyncMonitor:
         config_file: Optional[Path] = None
     ):
         self.file_pairs = file_pairs
+        for idx, pair in enumerate(file_pairs, 1):
+            pair.index_str = f"{idx}"
         self.check_interval = check_interval
         self.enable_notifications = enable_notifications
         self.running = False
         self.last_update = datetime.now()
         
+        # Hashing and copying are I/O-bound and release the GIL
+        self.pool = ThreadPoolExecutor(max_workers=max(1, min(32, len(file_pairs))))
+        self._stats_lock = threading.Lock()
+        
+        # Pending notifications, flushed as one message per type after a short debounce
+        self._pending_notifications: List[Tuple[str, str, str, str]] = []
+        self._notification_lock = threading.Lock()
+        self._notification_timer: Optional[threading.Timer] = None
+        
         # Load configuration if provided
         self.config = self._load_config(config_file) if config_file else {}
         
+        # Persistent hash cache: abs path -> [size, mtime_ns, hash]
+        cache_dir = config_file.resolve().parent if config_file else Path(__file__).parent
+        self.hash_cache_file = cache_dir / HASH_CACHE_NAME
+        self.hash_cache = self._load_hash_cache(self.hash_cache_file)
+        self._cache_lock = threading.Lock()
+        self._cache_dirty = self._prune_hash_cache()
+        self._cache_saved_at = time.monotonic()
+        
+        # Notification icon is read once and reused for every notification
+        self._icon_bytes = ICON_PATH.read_bytes() if ICON_PATH.exists() else None
+        
         # Initialize notifier
         self.notifier = self._init_notifier() if enable_notifications else None
         
@@ -172,46 +347,57 @@ class SyncMonitor:
             Layout(name="files", ratio=2),
             Layout(name="stats", ratio=1)
         )
-    
-    def _create_header(self) -> Panel:
-        """Create header panel"""
-        title = Text("📁 PyPIHub Sync Monitor", style="bold cyan")
-        subtitle = Text("Real-time file synchronization", style="dim")
-        
-        if self.running:
-            status = Text(" 🟢 ") + Text("RUNNING ", style="bold #00FF00")
-        else:
-            status = Text(" 🟥 ") + Text("STOPPED ", style="bold white on red")
         
-        return Panel(
-            Group(title, subtitle),
-            title=status,
+        # Static renderables, built once and reused on every frame
+        header_body = Group(
+            Text("📁 PyPIHub Sync Monitor", style="bold cyan"),
+            Text("Real-time file synchronization", style="dim")
+        )
+        self._header_running = Panel(
+            header_body,
+            title=Text(" 🟢 ") + Text("RUNNING ", style="bold #00FF00"),
             border_style="cyan",
             padding=(0, 1)
         )
-    
-    def _create_files_table(self) -> Table:
-        """Create files status table"""
-        table = Table(
+        self._header_stopped = Panel(
+            header_body,
+            title=Text(" 🟥 ") + Text("STOPPED ", style="bold white on red"),
+            border_style="cyan",
+            padding=(0, 1)
+        )
+        self._footer_suffix = [
+            Text("Press ", style="dim"),
+            Text("Ctrl+C", style="bold red"),
+            Text("to stop", style="dim"),
+        ]
+        
+        # Files table settings; the table itself is rebuilt each frame
+        self._files_table_options = dict(
             title="[bold]Files Being Monitored[/bold]",
             box=box.ROUNDED,
             show_header=True,
             header_style="bold magenta",
             expand=True
         )
+        self._files_table_columns = [
+            ("#", dict(style="dim", width=3)),
+            ("File", dict(style="cyan", width=25)),
+            ("Status", dict(width=10)),
+            ("Last Sync", dict(width=12)),
+            ("Size", dict(width=8, justify="right")),
+        ]
+    
+    def _create_header(self) -> Panel:
+        """Create header panel"""
+        return self._header_running if self.running else self._header_stopped
+    
+    def _create_files_table(self, now: datetime) -> Table:
+        """Create files status table"""
+        table = Table(**self._files_table_options)
+        for header, options in self._files_table_columns:
+            table.add_column(header, **options)
         
-        table.add_column("#", style="dim", width=3)
-        table.add_column("File", style="cyan", width=25)
-        table.add_column("Status", width=10)
-        table.add_column("Last Sync", width=12)
-        table.add_column("Size", width=8, justify="right")
-        
-        for idx, pair in enumerate(self.file_pairs, 1):
-            # File name with truncation if needed
-            filename = pair.source.name
-            if len(filename) > 20:
-                filename = filename[:17] + "..."
-            
+        for pair in self.file_pairs:
             # Status styling
             if pair.status == "synced":
                 status_icon = "✅"
@@ -233,9 +419,10 @@ class SyncMonitor:
             # Last sync time
             if pair.last_sync:
                 last_sync = pair.last_sync.strftime("%H:%M:%S")
-                if (datetime.now() - pair.last_sync).seconds < 10:
+                age = (now - pair.last_sync).total_seconds()
+                if age < 10:
                     sync_style = "bold green"
-                elif (datetime.now() - pair.last_sync).seconds < 60:
+                elif age < 60:
                     sync_style = "green"
                 else:
                     sync_style = "dim"
@@ -244,20 +431,19 @@ class SyncMonitor:
                 sync_style = "dim"
             
             # File size
-            try:
-                size = pair.source.stat().st_size
-                if size < 1024:
-                    size_text = f"{size}B"
-                elif size < 1024 * 1024:
-                    size_text = f"{size/1024:.1f}KB"
-                else:
-                    size_text = f"{size/(1024*1024):.1f}MB"
-            except:
+            size = pair.cached_size()
+            if size is None:
                 size_text = "N/A"
+            elif size < 1024:
+                size_text = f"{size}B"
+            elif size < 1024 * 1024:
+                size_text = f"{size/1024:.1f}KB"
+            else:
+                size_text = f"{size/(1024*1024):.1f}MB"
             
             table.add_row(
-                f"{idx}",
-                filename,
+                pair.index_str,
+                pair.display_name,
                 f"{status_icon} {status_text}",
                 f"[{sync_style}]{last_sync}[/]",
                 f"[dim]{size_text}[/]"
@@ -265,11 +451,11 @@ class SyncMonitor:
         
         return table
     
-    def _create_stats_panel(self) -> Panel:
+    def _create_stats_panel(self, now: datetime) -> Panel:
         """Create statistics panel"""
         # Uptime calculation
         if self.stats['start_time']:
-            uptime = datetime.now() - self.stats['start_time']
+            uptime = now - self.stats['start_time']
             self.stats['uptime'] = uptime
             uptime_str = str(uptime).split('.')[0]  # Remove microseconds
         else:
@@ -280,55 +466,48 @@ class SyncMonitor:
         
         # Uptime and interval
         
-        stats_content.append(Text("📈 Uptime: ", style="dim") + Text(f"{uptime_str}", style="cyan"))
+        stats_content.append(Text.assemble(("📈 Uptime: ", "dim"), (uptime_str, "cyan")))
         stats_content.append(
-            Text(f"⏰ Interval: ", style="dim") + Text(f"{self.check_interval}s", style="cyan")
+            Text.assemble(("⏰ Interval: ", "dim"), (f"{self.check_interval}s", "cyan"))
         )
         stats_content.append(Text(""))  # Spacer
         
-        # Sync statistics
-        sync_rate = self.stats['sync_count'] / max(self.stats['uptime'].seconds, 1)
+        # Sync statistics (total_seconds(): timedelta.seconds wraps every 24 h)
+        uptime_s = max(self.stats['uptime'].total_seconds(), 1.0)
+        sync_rate = self.stats['sync_count'] / uptime_s
         stats_content.append(
-            Text(f"📊 Total Syncs: ", style="dim") + \
-            Text(f"{self.stats['sync_count']}", style="green")
+            Text.assemble(("📊 Total Syncs: ", "dim"), (str(self.stats['sync_count']), "green"))
         )
 
         stats_content.append(
-            Text(f"⚡ Sync Rate: ", style="dim") + \
-            Text(f"{sync_rate:.2f}/sec", style="yellow")
+            Text.assemble(("⚡ Sync Rate: ", "dim"), (f"{sync_rate:.2f}/sec", "yellow"))
         )
         
         # Error statistics
         if self.stats['error_count'] > 0:
             stats_content.append(
-                Text(f"❌ Errors: ", style="dim") + \
-                Text(f"{self.stats['error_count']}", style="bold red")
+                Text.assemble(("❌ Errors: ", "dim"), (str(self.stats['error_count']), "bold red"))
             )
         else:
             stats_content.append(
-                Text(f"✅ Errors: ", style="dim") + \
-                Text(f"{self.stats['error_count']}", style="bold red")
+                Text.assemble(("✅ Errors: ", "dim"), (str(self.stats['error_count']), "bold red"))
             )
         
         # File statistics
-        synced = sum(1 for p in self.file_pairs if p.status == "synced")
-        self.stats['synced_files'] = synced
+        synced = self.stats['synced_files']
         stats_content.append(Text(""))  # Spacer
         stats_content.append(
-            Text(f"📁 Total Files: ", style="dim") + \
-            Text(f"{self.stats['total_files']}", style="bold #00FFFF")
+            Text.assemble(("📁 Total Files: ", "dim"), (str(self.stats['total_files']), "bold #00FFFF"))
         )
         stats_content.append(
-            Text(f"✅ Synced: ", style="dim") + \
-            Text(f"{synced}", style="bold #00FF00")
+            Text.assemble(("✅ Synced: ", "dim"), (str(synced), "bold #00FF00"))
         )
         stats_content.append(
-            Text(f"⏳ Pending: ", style="dim") + \
-            Text(f"{self.stats['total_files'] - synced}", style="bold #FFFF00"))
+            Text.assemble(("⏳ Pending: ", "dim"), (str(self.stats['total_files'] - synced), "bold #FFFF00")))
         
         # Last sync time
         if self.stats['last_sync']:
-            last_sync_diff = (datetime.now() - self.stats['last_sync']).seconds
+            last_sync_diff = (now - self.stats['last_sync']).total_seconds()
             if last_sync_diff < 5:
                 last_sync_style = "bold green"
             elif last_sync_diff < 60:
@@ -339,8 +518,7 @@ class SyncMonitor:
             last_sync_str = self.stats['last_sync'].strftime("%H:%M:%S")
             stats_content.append(Text(""))  # Spacer
             stats_content.append(
-                Text(f"🕒 Last Sync: ", style="dim") + \
-                Text(f"{last_sync_str}", style=last_sync_style)
+                Text.assemble(("🕒 Last Sync: ", "dim"), (last_sync_str, last_sync_style))
             )
         
         return Panel(
@@ -350,15 +528,12 @@ class SyncMonitor:
             padding=(0, 1)
         )
     
-    def _create_footer(self) -> Panel:
+    def _create_footer(self, now: datetime) -> Panel:
         """Create footer panel"""
-        now = datetime.now()
         footer_text = Columns([
             Text(f"📅 {now.strftime('%Y-%m-%d')}", style="dim"),
             Text(f"🕐 {now.strftime('%H:%M:%S')}", style="dim"),
-            Text("Press ", style="dim"),
-            Text("Ctrl+C", style="bold red"),
-            Text("to stop", style="dim"),
+            *self._footer_suffix,
         ])
         
         return Panel(
@@ -372,21 +547,15 @@ class SyncMonitor:
         if not self.layout:
             return Group(Text("Rich not available", style="bold red"))
         
-        # Update layout with current content
+        # Update layout with current content (one clock read per frame)
+        now = datetime.now()
         self.layout["header"].update(self._create_header())
-        self.layout["files"].update(self._create_files_table())
-        self.layout["stats"].update(self._create_stats_panel())
-        self.layout["footer"].update(self._create_footer())
+        self.layout["files"].update(self._create_files_table(now))
+        self.layout["stats"].update(self._create_stats_panel(now))
+        self.layout["footer"].update(self._create_footer(now))
         
         return self.layout
     
-    def _display_status_live(self):
-        """Display status using Live display"""
-        if not RICH_AVAILABLE or not self.live:
-            return
-        
-        self.live.update(self._create_live_display())
-    
     def _load_config(self, config_path: Path) -> Dict:
         """Load configuration from JSON file"""
         try:
@@ -396,6 +565,95 @@ class SyncMonitor:
             logger.warning(f"Failed to load config: {e}")
             return {}
     
+    @staticmethod
+    def _load_hash_cache(cache_path: Path) -> Dict[str, list]:
+        """Load the persistent hash cache (ignored if written with another hash algorithm)"""
+        try:
+            with open(cache_path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Failed to load hash cache: {e}")
+            return {}
+        
+        if not isinstance(data, dict) or data.get('algorithm') != HASH_NAME:
+            return {}
+        files = data.get('files')
+        if not isinstance(files, dict):
+            return {}
+        
+        # Drop malformed entries instead of failing later in _cached_hash
+        return {
+            path: entry for path, entry in files.items()
+            if isinstance(entry, list) and len(entry) == 3
+            and isinstance(entry[0], int) and isinstance(entry[1], int) and isinstance(entry[2], str)
+        }
+    
+    def _save_hash_cache(self):
+        """Atomically write the hash cache to disk"""
+        with self._cache_lock:
+            if not self._cache_dirty:
+                return
+            self._prune_hash_cache()
+            tmp_path = None
+            try:
+                with tempfile.NamedTemporaryFile(
+                    'w', dir=self.hash_cache_file.parent, prefix=HASH_CACHE_NAME + ".", delete=False
+                ) as f:
+                    tmp_path = f.name
+                    json.dump({'algorithm': HASH_NAME, 'files': self.hash_cache}, f)
+                os.replace(tmp_path, self.hash_cache_file)
+                self._cache_dirty = False
+            except Exception as e:
+                logger.warning(f"Failed to save hash cache: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self._cache_saved_at = time.monotonic()
+    
+    def _prune_hash_cache(self) -> bool:
+        """Drop cache entries that are no longer a pair's source or target"""
+        known = {os.path.abspath(path) for pair in self.file_pairs for path in (pair.source, pair.target)}
+        stale = [path for path in self.hash_cache if path not in known]
+        for path in stale:
+            del self.hash_cache[path]
+        return bool(stale)
+    
+    def _cached_hash(self, path: Path, st: os.stat_result) -> Optional[str]:
+        """Return the cached hash of path if its (size, mtime_ns) still match"""
+        entry = self.hash_cache.get(os.path.abspath(path))
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        return None
+    
+    def _remember_hash(self, path: Path, st: os.stat_result, file_hash: str):
+        """Store a hash in the cache, persisting it at most every HASH_CACHE_SAVE_INTERVAL"""
+        with self._cache_lock:
+            self.hash_cache[os.path.abspath(path)] = [st.st_size, st.st_mtime_ns, file_hash]
+            self._cache_dirty = True
+            save_due = time.monotonic() - self._cache_saved_at >= HASH_CACHE_SAVE_INTERVAL
+        if save_due:
+            self._save_hash_cache()
+    
+    def _hash_file(self, path: Path, st: Optional[os.stat_result] = None) -> Tuple[os.stat_result, Optional[str]]:
+        """Hash a file, using the persistent cache when its (size, mtime_ns) are unchanged"""
+        if st is not None:
+            cached = self._cached_hash(path, st)
+            if cached is not None:
+                return st, cached
+        
+        # Stat the descriptor that is actually hashed
+        with open(path, 'rb', buffering=0) as f:
+            st = os.fstat(f.fileno())
+            cached = self._cached_hash(path, st)
+            if cached is not None:
+                return st, cached
+            file_hash = self.calculate_file_hash(f)
+        
+        if file_hash is not None:
+            self._remember_hash(path, st, file_hash)
+        return st, file_hash
+    
     def _init_notifier(self):
         """Initialize notification system"""
         if not GROWL_AVAILABLE:
@@ -403,18 +661,11 @@ class SyncMonitor:
             return None
         
         try:
-            icon_file = Path(__file__).parent / "pypihub.png"
-            icon_data = None
-            
-            if icon_file.exists():
-                with open(icon_file, "rb") as f:
-                    icon_data = f.read()
-            
             growl = GrowlNotifier(  # type: ignore
                 applicationName="PyPIHub Sync",
                 notifications=["file_changed", "sync_error"],
                 defaultNotifications=["file_changed"],
-                applicationIcon=icon_data,
+                applicationIcon=self._icon_bytes,
             )
             growl.register()
             return growl
@@ -422,22 +673,47 @@ class SyncMonitor:
             logger.exception(f"Failed to initialize notifier: {e}")
             return None
     
+    def _queue_notification(self, title: str, message: str, item: str, note_type: str = "file_changed"):
+        """Queue a notification; restart the debounce timer so bursts are sent together"""
+        if not (self.notifier and self.enable_notifications):
+            return
+        
+        with self._notification_lock:
+            self._pending_notifications.append((note_type, title, message, item))
+            if self._notification_timer:
+                self._notification_timer.cancel()
+            self._notification_timer = threading.Timer(NOTIFICATION_DEBOUNCE, self._flush_notifications)
+            self._notification_timer.daemon = True
+            self._notification_timer.start()
+    
+    def _flush_notifications(self):
+        """Send queued notifications, one message per notification type"""
+        with self._notification_lock:
+            pending, self._pending_notifications = self._pending_notifications, []
+            if self._notification_timer:
+                self._notification_timer.cancel()
+                self._notification_timer = None
+        
+        grouped: Dict[str, List[Tuple[str, str, str]]] = {}
+        for note_type, title, message, item in pending:
+            grouped.setdefault(note_type, []).append((title, message, item))
+        
+        for note_type, entries in grouped.items():
+            title, message, _ = entries[0]
+            if len(entries) > 1:
+                summary = NOTIFICATION_SUMMARIES.get(note_type, "notifications")
+                message = f"{len(entries)} {summary}:\n" + "\n".join(f" {item}" for _, _, item in entries)
+            self._send_notification(title, message, note_type)
+    
     def _send_notification(self, title: str, message: str, note_type: str = "file_changed"):
         """Send notification if enabled"""
         if self.notifier and self.enable_notifications:
             try:
-                icon_file = Path(__file__).parent / "pypihub.png"
-                icon_data = None
-                
-                if icon_file.exists():
-                    with open(icon_file, "rb") as f:
-                        icon_data = f.read()
-                
                 self.notifier.notify(
                     noteType=note_type,
                     title=title,
                     description=message,
-                    icon=icon_data,
+                    icon=self._icon_bytes,
                     sticky=False,
                     priority=1,
                 )
@@ -445,41 +721,96 @@ class SyncMonitor:
                 logger.warning(f"Failed to send notification: {e}")
     
     @staticmethod
-    def calculate_file_hash(file_path: Path) -> Optional[str]:
-        """Calculate SHA256 hash of a file"""
+    def calculate_file_hash(f: BinaryIO) -> Optional[str]:
+        """Calculate a content hash (xxh3_64, blake3 or SHA256) of an open binary file"""
         try:
-            hasher = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(4096), b''):
-                    hasher.update(chunk)
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, HASH_FACTORY).hexdigest()
+            
+            # Fallback for Python < 3.11: read in 1 MiB chunks
+            hasher = HASH_FACTORY()
+            buf = bytearray(CHUNK_SIZE)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
             return hasher.hexdigest()
         except Exception as e:
-            logger.exception(f"Failed to hash file {file_path}: {e}")
+            logger.exception(f"Failed to hash file {getattr(f, 'name', f)}: {e}")
             return None
     
+    def _set_status(self, file_pair: FilePair, status: str):
+        """Set a pair's status, keeping the synced-files counter up to date"""
+        with self._stats_lock:
+            if file_pair.status != status:
+                if file_pair.status == "synced":
+                    self.stats['synced_files'] -= 1
+                elif status == "synced":
+                    self.stats['synced_files'] += 1
+            file_pair.status = status
+    
+    def _source_missing(self, file_pair: FilePair) -> bool:
+        """Mark a pair whose source vanished (not counted as a sync error, no notification)"""
+        if file_pair.status != "error":
+            logger.warning(f"Source file does not exist: {file_pair.source}")
+        self._set_status(file_pair, "error")
+        file_pair.error_count += 1
+        return False
+    
     def sync_file(self, file_pair: FilePair) -> bool:
         """Synchronize a single file pair"""
+        # The event worker and the periodic sweep may pick the same pair concurrently
+        with file_pair.lock:
+            return self._sync_file(file_pair)
+    
+    def _sync_file(self, file_pair: FilePair) -> bool:
+        """Synchronize a single file pair (caller holds file_pair.lock)"""
         try:
+            # Fast path: skip hashing when neither side changed since last sync
+            try:
+                source_stat = os.stat(file_pair.source)
+            except FileNotFoundError:
+                return self._source_missing(file_pair)
+            file_pair.note_size(source_stat.st_size)
+            if file_pair.is_unchanged(source_stat):
+                self._set_status(file_pair, "synced")
+                return True
+            
             # Update status to syncing
-            file_pair.status = "syncing"
-            self._display_status_live()
+            self._set_status(file_pair, "syncing")
             
             # Calculate hashes
-            source_hash = self.calculate_file_hash(file_pair.source)
+            try:
+                source_stat, source_hash = self._hash_file(file_pair.source, source_stat)
+            except FileNotFoundError:
+                return self._source_missing(file_pair)
+            file_pair.note_size(source_stat.st_size)
             if source_hash is None:
-                file_pair.status = "error"
+                self._set_status(file_pair, "error")
                 file_pair.error_count += 1
                 return False
             
+            # Content unchanged (e.g. touched) and nobody wrote the target: no need to hash it
+            if source_hash == file_pair.last_hash and file_pair.target_unchanged():
+                file_pair.last_source_mtime_ns = source_stat.st_mtime_ns
+                file_pair.last_source_size = source_stat.st_size
+                self._set_status(file_pair, "synced")
+                return True
+            
             target_hash = None
-            if file_pair.target.exists():
-                target_hash = self.calculate_file_hash(file_pair.target)
+            target_stat = None
+            try:
+                target_stat, target_hash = self._hash_file(file_pair.target)
+            except FileNotFoundError:
+                pass
             
             # Check if synchronization is needed
             if source_hash == target_hash:
-                file_pair.status = "synced"
-                self._display_status_live()
+                file_pair.last_hash = source_hash
+                file_pair.remember_stat(source_stat, target_stat)
+                self._set_status(file_pair, "synced")
                 return True
             
             # Perform synchronization
@@ -489,17 +820,22 @@ class SyncMonitor:
             file_pair.target.parent.mkdir(parents=True, exist_ok=True)
             
             # Copy file with metadata
-            shutil.copy2(file_pair.source, file_pair.target)
+            _fast_copy(file_pair.source, file_pair.target)
             
             # Update file pair status
+            target_stat = os.stat(file_pair.target)
             file_pair.last_hash = source_hash
-            file_pair.last_sync = datetime.now()
-            file_pair.status = "synced"
+            file_pair.remember_stat(source_stat, target_stat)
+            self._remember_hash(file_pair.target, target_stat, source_hash)
+            now = datetime.now()
+            file_pair.last_sync = now
+            self._set_status(file_pair, "synced")
             
             # Update statistics
-            self.stats['sync_count'] += 1
-            self.stats['last_sync'] = datetime.now()
-            self.last_update = datetime.now()
+            with self._stats_lock:
+                self.stats['sync_count'] += 1
+                self.stats['last_sync'] = now
+                self.last_update = now
             
             # Log and notify
             message = f"{file_pair.source.name} synchronized successfully"
@@ -508,9 +844,10 @@ class SyncMonitor:
             if RICH_AVAILABLE:
                 console.print(f"[green]✅[/green] {message}")
             
-            self._send_notification(
+            self._queue_notification(
                 "File Synchronized",
                 f"{file_pair.source.name} → {file_pair.target}",
+                file_pair.source.name,
                 "file_changed"
             )
             
@@ -520,22 +857,22 @@ class SyncMonitor:
             error_msg = f"Failed to sync {file_pair.source}: {e}"
             logger.exception(error_msg)
             
-            file_pair.status = "error"
+            self._set_status(file_pair, "error")
             file_pair.error_count += 1
-            self.stats['error_count'] += 1
+            with self._stats_lock:
+                self.stats['error_count'] += 1
             
             if RICH_AVAILABLE:
                 console.print(f"[red]❌[/red] {error_msg}")
             
-            self._send_notification(
+            self._queue_notification(
                 "Sync Error",
                 error_msg,
+                file_pair.source.name,
                 "sync_error"
             )
             
             return False
-        finally:
-            self._display_status_live()
     
     def validate_all_pairs(self) -> bool:
         """Validate all file pairs before starting"""
@@ -588,17 +925,18 @@ class SyncMonitor:
         
         # Initial sync
         logger.info("Performing initial sync...")
-        for pair in self.file_pairs:
-            self.sync_file(pair)
+        self.sync_all()
         
         # Setup live display
         if RICH_AVAILABLE:
+            # Live pulls a fresh frame on its own 4 Hz timer; syncing never triggers renders
             with Live(
-                self._create_live_display(),
                 console=console,
+                auto_refresh=True,
                 refresh_per_second=4,  # Smooth refresh rate
                 screen=True,  # Clear screen on start
-                vertical_overflow="visible"
+                vertical_overflow="visible",
+                get_renderable=self._create_live_display
             ) as self.live:
                 self._monitor_loop()
         else:
@@ -607,19 +945,98 @@ class SyncMonitor:
             print("Press Ctrl+C to stop\n")
             self._monitor_loop()
     
+    def sync_all(self, file_pairs: Optional[List[FilePair]] = None):
+        """Synchronize file pairs (default: all) concurrently and wait for completion"""
+        pairs = self.file_pairs if file_pairs is None else file_pairs
+        wait([self.pool.submit(self.sync_file, pair) for pair in pairs])
+    
     def _monitor_loop(self):
         """Main monitoring loop without Live context manager"""
+        if WATCHDOG_AVAILABLE:
+            self._watch_loop()
+        else:
+            self._poll_loop()
+    
+    def _start_observers(self, pending: "queue.Queue[FilePair]") -> List:
+        """Start one observer per watched directory (polling for network shares)"""
+        # Targets are watched too, so deleted or overwritten targets are restored
+        pairs_by_source = {str(pair.source.resolve()): pair for pair in self.file_pairs}
+        pairs_by_target = {str(pair.target.resolve()): pair for pair in self.file_pairs}
+        handler = SyncEventHandler(pairs_by_source, pairs_by_target, pending)
+        
+        local_observer = Observer()
+        polling_observer = None
+        directories = {str(Path(path).parent) for path in [*pairs_by_source, *pairs_by_target]}
+        for directory in filter(os.path.isdir, directories):
+            if is_network_path(Path(directory)):
+                if polling_observer is None:
+                    polling_observer = PollingObserver(timeout=self.check_interval)
+                polling_observer.schedule(handler, directory, recursive=False)
+            else:
+                local_observer.schedule(handler, directory, recursive=False)
+        
+        observers = [local_observer] if polling_observer is None else [local_observer, polling_observer]
+        for observer in observers:
+            observer.start()
+        return observers
+    
+    def _sync_worker(self, pending: "queue.Queue[FilePair]"):
+        """Drain queued file pairs and synchronize them"""
+        while self.running:
+            try:
+                pair = pending.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            self.sync_file(pair)
+    
+    def _watch_loop(self):
+        """Event-driven monitoring loop (watchdog)"""
+        pending: "queue.Queue[FilePair]" = queue.Queue()
+        observers = []
+        worker = None
+        try:
+            observers = self._start_observers(pending)
+            worker = threading.Thread(target=self._sync_worker, args=(pending,), daemon=True)
+            worker.start()
+            
+            # Retry pairs that are not synced every interval; a full safety sweep
+            # (changes the observers cannot see) runs far less often
+            last_full_sweep = time.monotonic()
+            while self.running:
+                time.sleep(self.check_interval)
+                if time.monotonic() - last_full_sweep >= FULL_SWEEP_INTERVAL:
+                    last_full_sweep = time.monotonic()
+                    self.sync_all()
+                else:
+                    unsynced = [pair for pair in self.file_pairs if pair.status != "synced"]
+                    if unsynced:
+                        self.sync_all(unsynced)
+                
+        except KeyboardInterrupt:
+            logger.info("Monitor stopped by user")
+            print("\n[bold yellow]Monitor stopped[/bold yellow]" if RICH_AVAILABLE else "\nMonitor stopped")
+        except Exception as e:
+            logger.exception(f"Monitor error: {e}")
+            raise
+        finally:
+            # Let the worker finish its current sync before stop() flushes/saves
+            self.running = False
+            for observer in observers:
+                observer.stop()
+            for observer in observers:
+                observer.join()
+            if worker is not None:
+                worker.join()
+            self.stop()
+    
+    def _poll_loop(self):
+        """Polling monitoring loop (fallback when watchdog is not installed)"""
         try:
             while self.running:
                 start_time = time.time()
                 
                 # Sync all files
-                for pair in self.file_pairs:
-                    self.sync_file(pair)
-                    time.sleep(0.1)  # Small delay between files for smooth display
-                
-                # Update display
-                self._display_status_live()
+                self.sync_all()
                 
                 # Calculate sleep time to maintain consistent interval
                 elapsed = time.time() - start_time
@@ -638,6 +1055,9 @@ class SyncMonitor:
     def stop(self):
         """Stop the monitor"""
         self.running = False
+        self.pool.shutdown(wait=True)
+        self._flush_notifications()
+        self._save_hash_cache()
         logger.info("Monitor stopped")
         
         # Display final statistics
@@ -665,6 +1085,21 @@ class SyncMonitor:
                 print(f"  Files monitored: {self.stats['total_files']}")
                 print(f"{'='*60}")
 
+def _scan_files(root: str):
+    """Yield paths of all files below root using os.scandir (no per-file stat on most platforms)"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError as e:
+            logger.warning(f"Cannot scan {directory}: {e}")
+
 def create_file_pairs_from_config(config: Dict) -> List[FilePair]:
     """Create file pairs from configuration"""
     file_pairs = []
@@ -681,14 +1116,37 @@ def create_file_pairs_from_config(config: Dict) -> List[FilePair]:
         source_dir = Path(config['source_dir']).resolve()
         target_dir = Path(config['target_dir']).resolve()
         
-        # Get all files from source directory
-        for pattern in config.get('patterns', ['*.py', '*.ini', '*.txt']):
+        # Plain "*.ext" patterns are matched by suffix, other basename patterns with
+        # fnmatch (both case-insensitive on Windows, like rglob). Patterns containing
+        # a path separator still go through rglob.
+        patterns = config.get('patterns', ['*.py', '*.ini', '*.txt'])
+        name_patterns = [p for p in patterns if '/' not in p and '\\' not in p]
+        path_patterns = [p for p in patterns if p not in name_patterns]
+        suffixes = tuple(
+            os.path.normcase(p[1:]) for p in name_patterns
+            if p.startswith('*.') and not any(c in p[1:] for c in '*?[')
+        )
+        globs = [p for p in name_patterns if not (p.startswith('*.') and os.path.normcase(p[1:]) in suffixes)]
+        
+        source_files = []
+        # Get all files from source directory in a single tree traversal
+        for path in _scan_files(str(source_dir)):
+            name = os.path.basename(path)
+            if os.path.normcase(name).endswith(suffixes) or any(fnmatch.fnmatch(name, g) for g in globs):
+                source_files.append(Path(path))
+        
+        seen = set(source_files)
+        for pattern in path_patterns:
             for source_file in source_dir.rglob(pattern):
-                if source_file.is_file():
-                    # Maintain relative path structure
-                    rel_path = source_file.relative_to(source_dir)
-                    target_file = target_dir / rel_path
-                    file_pairs.append(FilePair(source_file, target_file))
+                if source_file not in seen and source_file.is_file():
+                    seen.add(source_file)
+                    source_files.append(source_file)
+        
+        for source_file in source_files:
+            # Maintain relative path structure
+            rel_path = source_file.relative_to(source_dir)
+            target_file = target_dir / rel_path
+            file_pairs.append(FilePair(source_file, target_file))
     
     return file_pairs
 
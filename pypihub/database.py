@@ -8,16 +8,16 @@
 
 from sqlalchemy import create_engine, Column, Integer, String, DateTime
 from sqlalchemy.orm import declarative_base, sessionmaker
-from datetime import datetime
+from datetime import datetime, timezone
 
 Base = declarative_base()
 
 class Package(Base):
     __tablename__ = 'packages'
     id = Column(Integer, primary_key=True)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, index=True)
     source = Column(String, nullable=False)  # 'pypi' or 'upload'
-    added = Column(DateTime, default=datetime.utcnow)
+    added = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     user_id = Column(String, nullable=True)
 
 class User(Base):
@@ -25,4 +25,27 @@ class User(Base):
     id = Column(Integer, primary_key=True)
     username = Column(String, unique=True, nullable=False)
     password = Column(String, nullable=False)
-    
+
+def bulk_insert_packages(engine, rows):
+    """Insert many packages (list of dicts) in one executemany round-trip.
+
+    Core executemany takes its column list from the first row, so every row is
+    normalized to the same keys: 'name' and 'source' are required, 'user_id'
+    defaults to None and 'added' to the current UTC time.
+    """
+    if not rows:
+        return
+    now = datetime.now(timezone.utc)
+    normalized = []
+    for row in rows:
+        unknown = set(row) - {'name', 'source', 'user_id', 'added'}
+        if unknown:
+            raise ValueError(f"Unknown package columns: {sorted(unknown)}")
+        normalized.append({
+            'name': row['name'],
+            'source': row['source'],
+            'user_id': row.get('user_id'),
+            'added': row.get('added') or now,
+        })
+    with engine.begin() as conn:
+        conn.execute(Package.__table__.insert(), normalized)